@@ -12,6 +12,7 @@ from flask import Flask
 from flask_cors import CORS
 from flask_jwt_extended import JWTManager
 from models import db
+from search import init_search_index, setup_lock
 from config import config
 
 # Import routes
@@ -37,9 +38,10 @@ def create_app(config_name='default'):
     app.register_blueprint(users_bp, url_prefix='/api/users')
     app.register_blueprint(sync_bp, url_prefix='/api/sync')
 
-    # Create tables
-    with app.app_context():
+    # Create tables and the full-text search index
+    with app.app_context(), setup_lock():
         db.create_all()
+        init_search_index()
 
     return app
 
@@ -17,6 +17,12 @@ class Config:
     MP_API_URL = os.environ.get('MP_API_URL') or 'https://standrew.ministryplatform.com/ministryplatformapi/procs/api_church_specific_get_events'
     MP_BEARER_TOKEN = os.environ.get('MP_BEARER_TOKEN')
 
+    # Full-text search (PostgreSQL text search configuration, page sizes)
+    SEARCH_TEXT_CONFIG = os.environ.get('SEARCH_TEXT_CONFIG') or 'english'
+    SEARCH_PER_PAGE = 20
+    SEARCH_MAX_PER_PAGE = 100
+    SEARCH_MAX_OFFSET = 10000
+
     # Room IDs for large event spaces
     TRACKED_ROOMS = {
         100: 'Sanctuary',
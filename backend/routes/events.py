@@ -1,6 +1,7 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from models import db, Event, EventNote, EventAssignment, User
+from search import search_events, reindex_events
 from datetime import datetime
 
 events_bp = Blueprint('events', __name__)
@@ -28,6 +29,31 @@ def get_events():
     return jsonify([event.to_dict() for event in events]), 200
 
 
+@events_bp.route('/search', methods=['GET'])
+@jwt_required()
+def search():
+    """Full-text search over event titles and notes, ranked and paginated"""
+    q = request.args.get('q', '').strip()
+    if not q:
+        return jsonify({'error': 'Search query is required'}), 400
+
+    page = max(request.args.get('page', 1, type=int), 1)
+    per_page = request.args.get('per_page', current_app.config['SEARCH_PER_PAGE'], type=int)
+    per_page = min(max(per_page, 1), current_app.config['SEARCH_MAX_PER_PAGE'])
+    if (page - 1) * per_page > current_app.config['SEARCH_MAX_OFFSET']:
+        return jsonify({'error': 'Page out of range'}), 400
+    include_cancelled = request.args.get('include_cancelled', 'false').lower() == 'true'
+
+    results, total = search_events(q, page, per_page, include_cancelled)
+
+    return jsonify({
+        'results': [dict(event.to_dict(), rank=rank) for event, rank in results],
+        'total': total,
+        'page': page,
+        'per_page': per_page
+    }), 200
+
+
 @events_bp.route('/<int:event_id>', methods=['GET'])
 @jwt_required()
 def get_event(event_id):
@@ -61,6 +87,8 @@ def add_note(event_id):
     )
 
     db.session.add(note)
+    db.session.flush()
+    reindex_events([event_id])
     db.session.commit()
 
     return jsonify(note.to_dict()), 201
@@ -84,6 +112,8 @@ def update_note(event_id, note_id):
     if 'note' in data:
         note.note = data['note']
         note.updated_at = datetime.utcnow()
+        db.session.flush()
+        reindex_events([event_id])
 
     db.session.commit()
 
@@ -105,6 +135,8 @@ def delete_note(event_id, note_id):
         return jsonify({'error': 'Unauthorized'}), 403
 
     db.session.delete(note)
+    db.session.flush()
+    reindex_events([event_id])
     db.session.commit()
 
     return jsonify({'message': 'Note deleted successfully'}), 200
@@ -1,6 +1,7 @@
 from flask import Blueprint, jsonify, current_app
 from flask_jwt_extended import jwt_required
 from models import db, Event
+from search import reindex_events
 from datetime import datetime, timedelta
 import requests
 
@@ -43,6 +44,7 @@ def sync_events_to_db(events_data, tracked_rooms):
     """Sync events to database, filtering by tracked room IDs"""
     synced_count = 0
     updated_count = 0
+    touched_events = []
 
     # Flatten the nested array structure from MP API
     if events_data and isinstance(events_data[0], list):
@@ -96,6 +98,12 @@ def sync_events_to_db(events_data, tracked_rooms):
             db.session.add(event)
             synced_count += 1
 
+        touched_events.append(event)
+
+    # Flush so new events have ids, then refresh their search documents
+    db.session.flush()
+    reindex_events([event.id for event in touched_events])
+
     db.session.commit()
     return synced_count, updated_count
 
@@ -0,0 +1,205 @@
+from contextlib import contextmanager
+from flask import current_app
+from sqlalchemy import text, bindparam
+from sqlalchemy.orm import selectinload
+from models import db, Event, EventAssignment, EventNote
+
+# The search index is a side table keyed by events.id. Each row holds one
+# document built from the event title and all of its notes. PostgreSQL stores
+# it as a weighted tsvector behind a GIN index; SQLite uses an FTS5 virtual
+# table so search also works against a local SQLite DATABASE_URL.
+#
+# On PostgreSQL the row also carries copies of events.cancelled and
+# events.event_start_date so searches filter and sort without joining events.
+# Sync reindexes every event it touches, which keeps the copies current.
+
+POSTGRES_DDL = [
+    """
+    CREATE TABLE IF NOT EXISTS event_search (
+        event_id INTEGER PRIMARY KEY REFERENCES events(id) ON DELETE CASCADE,
+        document TSVECTOR NOT NULL,
+        cancelled BOOLEAN NOT NULL DEFAULT false,
+        event_start_date TIMESTAMP
+    )
+    """,
+    'CREATE INDEX IF NOT EXISTS ix_event_search_document ON event_search USING GIN (document)'
+]
+
+SQLITE_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS event_search
+    USING fts5(title, notes, tokenize = 'porter unicode61')
+    """
+]
+
+# Title matches (weight A / first column) rank above note matches
+POSTGRES_UPSERT = """
+    INSERT INTO event_search (event_id, document, cancelled, event_start_date)
+    SELECT e.id,
+           setweight(to_tsvector(CAST(:config AS regconfig), coalesce(e.event_title, '')), 'A') ||
+           setweight(to_tsvector(CAST(:config AS regconfig), coalesce(string_agg(n.note, ' '), '')), 'B'),
+           coalesce(e.cancelled, false),
+           e.event_start_date
+    FROM events e
+    LEFT JOIN event_notes n ON n.event_id = e.id
+    WHERE {where}
+    GROUP BY e.id
+    ON CONFLICT (event_id) DO UPDATE SET document = EXCLUDED.document,
+                                         cancelled = EXCLUDED.cancelled,
+                                         event_start_date = EXCLUDED.event_start_date
+"""
+
+SQLITE_INSERT = """
+    INSERT INTO event_search (rowid, title, notes)
+    SELECT e.id, coalesce(e.event_title, ''), coalesce(group_concat(n.note, ' '), '')
+    FROM events e
+    LEFT JOIN event_notes n ON n.event_id = e.id
+    WHERE {where}
+    GROUP BY e.id
+"""
+
+POSTGRES_SEARCH = """
+    SELECT s.event_id, ts_rank_cd(s.document, q.query) AS rank
+    FROM event_search s
+    CROSS JOIN websearch_to_tsquery(CAST(:config AS regconfig), :q) AS q(query)
+    WHERE s.document @@ q.query AND (:include_cancelled OR s.cancelled = false)
+    ORDER BY rank DESC, s.event_start_date, s.event_id
+    LIMIT :limit OFFSET :offset
+"""
+
+SQLITE_SEARCH = """
+    SELECT m.event_id, m.rank
+    FROM (
+        SELECT rowid AS event_id, -bm25(event_search, 10.0, 1.0) AS rank
+        FROM event_search
+        WHERE event_search MATCH :q
+    ) m
+    JOIN events e ON e.id = m.event_id
+    WHERE :include_cancelled OR e.cancelled = false
+    ORDER BY m.rank DESC, e.event_start_date, e.id
+    LIMIT :limit OFFSET :offset
+"""
+
+POSTGRES_COUNT = """
+    SELECT count(*)
+    FROM event_search s
+    CROSS JOIN websearch_to_tsquery(CAST(:config AS regconfig), :q) AS q(query)
+    WHERE s.document @@ q.query AND (:include_cancelled OR s.cancelled = false)
+"""
+
+SQLITE_COUNT = """
+    SELECT count(*)
+    FROM event_search s
+    JOIN events e ON e.id = s.rowid
+    WHERE event_search MATCH :q AND (:include_cancelled OR e.cancelled = false)
+"""
+
+# Arbitrary key for the advisory lock that serializes schema setup across workers
+SETUP_LOCK_KEY = 26026
+
+
+def _dialect():
+    """Return the name of the database backend in use"""
+    return db.engine.dialect.name
+
+
+@contextmanager
+def setup_lock():
+    """Run schema setup one worker at a time on PostgreSQL
+
+    Workers starting together would otherwise race on CREATE TABLE and fail
+    with duplicate key errors on the system catalogs.
+    """
+    if _dialect() != 'postgresql':
+        yield
+        return
+
+    with db.engine.connect() as connection:
+        connection.execute(text('SELECT pg_advisory_lock(:key)'), {'key': SETUP_LOCK_KEY})
+        try:
+            yield
+        finally:
+            connection.execute(text('SELECT pg_advisory_unlock(:key)'), {'key': SETUP_LOCK_KEY})
+
+
+def init_search_index():
+    """Create the search index table and backfill events missing from it"""
+    if _dialect() == 'postgresql':
+        for statement in POSTGRES_DDL:
+            db.session.execute(text(statement))
+        where = 'NOT EXISTS (SELECT 1 FROM event_search s WHERE s.event_id = e.id)'
+        db.session.execute(text(POSTGRES_UPSERT.format(where=where)),
+                           {'config': current_app.config['SEARCH_TEXT_CONFIG']})
+    elif _dialect() == 'sqlite':
+        for statement in SQLITE_DDL:
+            db.session.execute(text(statement))
+        where = 'NOT EXISTS (SELECT 1 FROM event_search s WHERE s.rowid = e.id)'
+        db.session.execute(text(SQLITE_INSERT.format(where=where)))
+    else:
+        raise ValueError(f'Full-text search is not supported on {_dialect()} databases '
+                         '(use PostgreSQL or SQLite)')
+
+    db.session.commit()
+
+
+def reindex_events(event_ids):
+    """Rebuild search documents for the given events in the current transaction"""
+    event_ids = list(set(event_ids))
+    if not event_ids:
+        return
+
+    ids_param = bindparam('ids', expanding=True)
+
+    if _dialect() == 'postgresql':
+        # Serialize rebuilds per event so each one sees notes committed by the
+        # writer before it. NO KEY UPDATE still allows the KEY SHARE lock taken
+        # by note inserts, so concurrent note writes cannot deadlock here.
+        lock = text('SELECT 1 FROM events WHERE id IN :ids ORDER BY id FOR NO KEY UPDATE').bindparams(ids_param)
+        db.session.execute(lock, {'ids': event_ids})
+
+        statement = text(POSTGRES_UPSERT.format(where='e.id IN :ids')).bindparams(ids_param)
+        db.session.execute(statement, {'ids': event_ids,
+                                       'config': current_app.config['SEARCH_TEXT_CONFIG']})
+    else:
+        # FTS5 tables have no upsert, so replace the rows outright
+        delete = text('DELETE FROM event_search WHERE rowid IN :ids').bindparams(ids_param)
+        insert = text(SQLITE_INSERT.format(where='e.id IN :ids')).bindparams(ids_param)
+        db.session.execute(delete, {'ids': event_ids})
+        db.session.execute(insert, {'ids': event_ids})
+
+
+def _fts5_query(q):
+    """Quote each search term so user input is never parsed as FTS5 syntax"""
+    terms = [term.replace('"', '""') for term in q.split()]
+    return ' '.join(f'"{term}"' for term in terms)
+
+
+def search_events(q, page=1, per_page=20, include_cancelled=False):
+    """Search event titles and notes, returning (events with rank, total matches)"""
+    params = {'include_cancelled': include_cancelled, 'limit': per_page, 'offset': (page - 1) * per_page}
+
+    if _dialect() == 'postgresql':
+        statement, count_statement = POSTGRES_SEARCH, POSTGRES_COUNT
+        params.update(q=q, config=current_app.config['SEARCH_TEXT_CONFIG'])
+    else:
+        statement, count_statement = SQLITE_SEARCH, SQLITE_COUNT
+        params.update(q=_fts5_query(q))
+
+    # Counting separately is cheaper than count(*) OVER (), which materializes
+    # every match before the top-N sort
+    total = db.session.execute(text(count_statement), params).scalar()
+    rows = db.session.execute(text(statement), params).all()
+    if not rows:
+        return [], total
+
+    ranks = {row[0]: row[1] for row in rows}
+    positions = {event_id: position for position, event_id in enumerate(ranks)}
+
+    # Load the page of events in one query, then restore ranked order
+    events = Event.query.options(
+        selectinload(Event.assignments).selectinload(EventAssignment.user),
+        selectinload(Event.notes).selectinload(EventNote.author)
+    ).filter(Event.id.in_(ranks.keys())).all()
+    events.sort(key=lambda event: positions[event.id])
+
+    return [(event, ranks[event.id]) for event in events], total
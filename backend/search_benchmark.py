@@ -0,0 +1,133 @@
+"""Seed a scratch database with synthetic events and time /api/events/search.
+
+Point DATABASE_URL at a throwaway database before running, e.g.
+
+    DATABASE_URL=sqlite:////tmp/search_bench.db python search_benchmark.py
+    DATABASE_URL=postgresql://eventuser:pw@localhost/event_search_bench python search_benchmark.py --explain projector
+"""
+import argparse
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from app import create_app
+from flask import current_app
+from flask_jwt_extended import create_access_token
+from sqlalchemy import text
+from models import db, User, Event, EventNote
+from search import init_search_index, POSTGRES_SEARCH
+
+TITLE_WORDS = ['Worship', 'Rehearsal', 'Youth', 'Choir', 'Prayer', 'Wedding', 'Funeral', 'Bible',
+               'Study', 'Concert', 'Conference', 'Retreat', 'Dinner', 'Meeting', 'Training', 'Recital',
+               'Baptism', 'Fellowship', 'Men', 'Women', 'Kids', 'Seniors', 'Grief', 'Support']
+NOTE_WORDS = ['projector', 'microphone', 'lapel', 'livestream', 'lighting', 'piano', 'drums',
+              'tables', 'chairs', 'stage', 'slides', 'recording', 'camera', 'speaker', 'mixer',
+              'batteries', 'hdmi', 'cable', 'podium', 'confidence', 'monitor', 'haze', 'rigging']
+QUERIES = ['worship', 'wedding rehearsal', 'projector', 'lapel microphone', 'youth camera',
+           'choir piano', 'livestream', 'haze rigging', 'kids', 'funeral recording']
+
+
+def seed(event_count, notes_per_event, batch_size=5000):
+    """Bulk insert synthetic events with notes, then build the search index"""
+    rng = random.Random(26)
+    user = User.query.filter_by(username='search_bench').first()
+    if not user:
+        user = User(username='search_bench', email='search_bench@example.com', full_name='Search Bench')
+        user.set_password('search_bench')
+        db.session.add(user)
+        db.session.commit()
+
+    start = datetime(2026, 1, 1)
+    first_id = (db.session.query(db.func.max(Event.event_id)).scalar() or 0) + 1
+
+    for offset in range(0, event_count, batch_size):
+        events = []
+        for i in range(offset, min(offset + batch_size, event_count)):
+            event_start = start + timedelta(hours=rng.randint(0, 24 * 365))
+            events.append({
+                'event_id': first_id + i,
+                'event_title': ' '.join(rng.sample(TITLE_WORDS, 3)),
+                'room_id': 100,
+                'room_name': 'Sanctuary',
+                'event_start_date': event_start,
+                'event_end_date': event_start + timedelta(hours=2),
+                'cancelled': rng.random() < 0.05
+            })
+        db.session.execute(db.insert(Event), events)
+
+        ids = db.session.query(Event.id).filter(
+            Event.event_id.between(first_id + offset, first_id + offset + batch_size - 1)
+        ).all()
+        notes = [{'event_id': event_id, 'user_id': user.id, 'note': ' '.join(rng.sample(NOTE_WORDS, 8))}
+                 for (event_id,) in ids for _ in range(notes_per_event)]
+        if notes:
+            db.session.execute(db.insert(EventNote), notes)
+        db.session.commit()
+
+    init_search_index()
+
+
+def explain(q):
+    """Print the PostgreSQL plan for one search, to confirm the GIN index is used"""
+    statement = text('EXPLAIN (ANALYZE, BUFFERS) ' + POSTGRES_SEARCH)
+    params = {'q': q, 'config': current_app.config['SEARCH_TEXT_CONFIG'], 'include_cancelled': False, 'limit': 20, 'offset': 0}
+    for (line,) in db.session.execute(statement, params):
+        print(line)
+
+
+def benchmark(client, token, runs):
+    """Time each query and return (query, p50 ms, p95 ms, total matches)"""
+    headers = {'Authorization': f'Bearer {token}'}
+    results = []
+    for q in QUERIES:
+        timings = []
+        for _ in range(runs):
+            began = time.perf_counter()
+            response = client.get('/api/events/search', query_string={'q': q}, headers=headers)
+            timings.append((time.perf_counter() - began) * 1000)
+        timings.sort()
+        p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+        results.append((q, statistics.median(timings), p95, response.get_json()['total']))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--events', type=int, default=100000)
+    parser.add_argument('--notes-per-event', type=int, default=1)
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--skip-seed', action='store_true')
+    parser.add_argument('--target-ms', type=float, default=200.0, help='p95 latency target per query')
+    parser.add_argument('--explain', metavar='QUERY', help='print EXPLAIN ANALYZE for QUERY (PostgreSQL only)')
+    args = parser.parse_args()
+
+    app = create_app('production')
+    with app.app_context():
+        if not args.skip_seed:
+            began = time.perf_counter()
+            seed(args.events, args.notes_per_event)
+            print(f'Seeded {args.events} events in {time.perf_counter() - began:.1f}s '
+                  f'({db.engine.dialect.name})')
+
+        if args.explain and db.engine.dialect.name == 'postgresql':
+            explain(args.explain)
+
+        user = User.query.filter_by(username='search_bench').first()
+        token = create_access_token(identity=str(user.id))
+
+    results = benchmark(app.test_client(), token, args.runs)
+
+    print(f'{"query":<22}{"p50 ms":>10}{"p95 ms":>10}{"matches":>10}')
+    for q, p50, p95, total in results:
+        print(f'{q:<22}{p50:>10.1f}{p95:>10.1f}{total:>10}')
+
+    slow = [q for q, _, p95, _ in results if p95 > args.target_ms]
+    if slow:
+        print(f'Over the {args.target_ms:.0f}ms p95 target: {", ".join(slow)}')
+        raise SystemExit(1)
+    print(f'All queries within the {args.target_ms:.0f}ms p95 target')
+
+
+if __name__ == '__main__':
+    main()
@@ -15,6 +15,9 @@ const EventBoard = () => {
   const [syncing, setSyncing] = useState(false);
   const [selectedEvent, setSelectedEvent] = useState(null);
   const [trackedRooms, setTrackedRooms] = useState({});
+  const [searchInput, setSearchInput] = useState('');
+  const [searchResults, setSearchResults] = useState(null);
+  const [searching, setSearching] = useState(false);
 
   useEffect(() => {
     fetchTrackedRooms();
@@ -96,6 +99,38 @@ const EventBoard = () => {
     }
   };
 
+  const runSearch = async (query, page) => {
+    setSearching(true);
+    try {
+      const response = await eventsAPI.searchEvents(query, page);
+      const { results, total } = response.data;
+      setSearchResults((previous) => ({
+        query,
+        page,
+        total,
+        results: page > 1 && previous ? [...previous.results, ...results] : results,
+      }));
+    } catch (error) {
+      console.error('Failed to search events:', error);
+      alert('Failed to search events');
+    } finally {
+      setSearching(false);
+    }
+  };
+
+  const handleSearch = (e) => {
+    e.preventDefault();
+    const query = searchInput.trim();
+    if (query) {
+      runSearch(query, 1);
+    }
+  };
+
+  const handleClearSearch = () => {
+    setSearchInput('');
+    setSearchResults(null);
+  };
+
   const handleEventClick = (event) => {
     setSelectedEvent(event);
   };
@@ -103,6 +138,9 @@ const EventBoard = () => {
   const handleCloseModal = () => {
     setSelectedEvent(null);
     fetchEvents(); // Refresh events after modal closes
+    if (searchResults) {
+      runSearch(searchResults.query, 1); // Notes may have changed what matches
+    }
   };
 
   const getRoomName = () => {
@@ -132,52 +170,92 @@ const EventBoard = () => {
             ))}
           </select>
         </div>
+        <form onSubmit={handleSearch} className="search-form">
+          <input
+            type="search"
+            value={searchInput}
+            onChange={(e) => setSearchInput(e.target.value)}
+            placeholder="Search titles and notes"
+            className="search-input"
+          />
+          <button type="submit" disabled={searching} className="btn-search">
+            {searching ? 'Searching...' : 'Search'}
+          </button>
+          {searchResults && (
+            <button type="button" onClick={handleClearSearch} className="btn-clear-search">
+              Clear
+            </button>
+          )}
+        </form>
         <button onClick={handleSync} disabled={syncing} className="btn-sync">
           {syncing ? 'Syncing...' : 'Sync Events'}
         </button>
       </div>
 
-      <div className="board-columns">
-        <div className="board-column">
-          <h2>Today ({filteredEvents.today.length})</h2>
+      {searchResults ? (
+        <div className="search-results">
+          <h2>
+            Results for "{searchResults.query}" ({searchResults.total})
+          </h2>
           <div className="events-list">
-            {filteredEvents.today.map((event) => (
+            {searchResults.results.map((event) => (
               <EventCard key={event.id} event={event} onClick={() => handleEventClick(event)} />
             ))}
-            {filteredEvents.today.length === 0 && <p className="no-events">No events today</p>}
+            {searchResults.total === 0 && <p className="no-events">No matching events</p>}
           </div>
+          {searchResults.results.length < searchResults.total && (
+            <button
+              onClick={() => runSearch(searchResults.query, searchResults.page + 1)}
+              disabled={searching}
+              className="btn-load-more"
+            >
+              {searching ? 'Loading...' : 'Load more'}
+            </button>
+          )}
         </div>
+      ) : (
+        <div className="board-columns">
+          <div className="board-column">
+            <h2>Today ({filteredEvents.today.length})</h2>
+            <div className="events-list">
+              {filteredEvents.today.map((event) => (
+                <EventCard key={event.id} event={event} onClick={() => handleEventClick(event)} />
+              ))}
+              {filteredEvents.today.length === 0 && <p className="no-events">No events today</p>}
+            </div>
+          </div>
 
-        <div className="board-column">
-          <h2>Tomorrow ({filteredEvents.tomorrow.length})</h2>
-          <div className="events-list">
-            {filteredEvents.tomorrow.map((event) => (
-              <EventCard key={event.id} event={event} onClick={() => handleEventClick(event)} />
-            ))}
-            {filteredEvents.tomorrow.length === 0 && <p className="no-events">No events tomorrow</p>}
+          <div className="board-column">
+            <h2>Tomorrow ({filteredEvents.tomorrow.length})</h2>
+            <div className="events-list">
+              {filteredEvents.tomorrow.map((event) => (
+                <EventCard key={event.id} event={event} onClick={() => handleEventClick(event)} />
+              ))}
+              {filteredEvents.tomorrow.length === 0 && <p className="no-events">No events tomorrow</p>}
+            </div>
           </div>
-        </div>
 
-        <div className="board-column">
-          <h2>Upcoming ({filteredEvents.upcoming.length})</h2>
-          <div className="events-list">
-            {filteredEvents.upcoming.map((event) => (
-              <EventCard key={event.id} event={event} onClick={() => handleEventClick(event)} />
-            ))}
-            {filteredEvents.upcoming.length === 0 && <p className="no-events">No upcoming events</p>}
+          <div className="board-column">
+            <h2>Upcoming ({filteredEvents.upcoming.length})</h2>
+            <div className="events-list">
+              {filteredEvents.upcoming.map((event) => (
+                <EventCard key={event.id} event={event} onClick={() => handleEventClick(event)} />
+              ))}
+              {filteredEvents.upcoming.length === 0 && <p className="no-events">No upcoming events</p>}
+            </div>
           </div>
-        </div>
 
-        <div className="board-column">
-          <h2>Past ({filteredEvents.past.length})</h2>
-          <div className="events-list">
-            {filteredEvents.past.slice(0, 10).map((event) => (
-              <EventCard key={event.id} event={event} onClick={() => handleEventClick(event)} />
-            ))}
-            {filteredEvents.past.length === 0 && <p className="no-events">No past events</p>}
+          <div className="board-column">
+            <h2>Past ({filteredEvents.past.length})</h2>
+            <div className="events-list">
+              {filteredEvents.past.slice(0, 10).map((event) => (
+                <EventCard key={event.id} event={event} onClick={() => handleEventClick(event)} />
+              ))}
+              {filteredEvents.past.length === 0 && <p className="no-events">No past events</p>}
+            </div>
           </div>
         </div>
-      </div>
+      )}
 
       {selectedEvent && <EventModal event={selectedEvent} onClose={handleCloseModal} />}
     </div>
@@ -34,6 +34,8 @@ export const eventsAPI = {
     const params = roomId ? { room_id: roomId } : {};
     return api.get('/events', { params });
   },
+  searchEvents: (q, page = 1, perPage = 20, includeCancelled = false) =>
+    api.get('/events/search', { params: { q, page, per_page: perPage, include_cancelled: includeCancelled } }),
   getEvent: (id) => api.get(`/events/${id}`),
   addNote: (eventId, note) => api.post(`/events/${eventId}/notes`, { note }),
   updateNote: (eventId, noteId, note) => api.put(`/events/${eventId}/notes/${noteId}`, { note }),